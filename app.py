@@ -3,16 +3,14 @@ from tkinter import filedialog, messagebox
 import threading
 import time
 import json
+import math
 import os
 import sys
-import glob
-import collections
+import functools
+import queue
 
 import numpy as np
 from proctap import ProcessAudioCapture
-from pycaw.pycaw import AudioUtilities, IAudioMeterInformation
-import pystray
-from PIL import Image, ImageDraw
 
 # Always use bundled VLC libraries
 _vlc_dll = os.path.join(os.path.dirname(os.path.abspath(__file__)), "libvlc.dll")
@@ -22,8 +20,9 @@ if hasattr(sys, '_MEIPASS'):
     _vlc_plugins = os.path.join(sys._MEIPASS, "plugins")
 os.environ['PYTHON_VLC_LIB_PATH'] = _vlc_dll
 os.environ['PYTHON_VLC_MODULE_PATH'] = _vlc_plugins
-
-import vlc
+# Whichever worker thread imports comtypes first joins the multithreaded COM
+# apartment, so the session objects the threads share are all MTA objects
+sys.coinit_flags = 0
 
 if hasattr(sys, '_MEIPASS'):
     CONFIG_FILE = os.path.join(os.path.dirname(sys.executable), "config.json")
@@ -44,70 +43,239 @@ DEFAULT_CONFIG = {
     "discord_mirror_fix": False,
 }
 
+# Settings that older or hand-edited config files may hold as strings
+INT_KEYS = ("silence_seconds", "max_volume", "duck_percent")
+
+# Contents of config.json as last read or written, to skip identical writes
+_last_saved_json = None
+
 def load_config():
+    global _last_saved_json
     if os.path.exists(CONFIG_FILE):
         try:
             with open(CONFIG_FILE, "r") as f:
-                cfg = json.load(f)
-                for k, v in DEFAULT_CONFIG.items():
-                    cfg.setdefault(k, v)
-                return cfg
+                data = f.read()
+            cfg = json.loads(data)
+            _last_saved_json = data
+            for k, v in DEFAULT_CONFIG.items():
+                cfg.setdefault(k, v)
+            for k in INT_KEYS:
+                try:
+                    cfg[k] = int(float(cfg[k]))
+                except (TypeError, ValueError):
+                    cfg[k] = DEFAULT_CONFIG[k]
+            return cfg
         except Exception:
             pass
     return dict(DEFAULT_CONFIG)
 
 def save_config(cfg):
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(cfg, f, indent=2)
-
-OWN_PROCESSES = {"python.exe", "pythonw.exe", "py.exe", "python3.exe", "silenceplayer.exe"}
-SUPPORTED_EXTENSIONS = ("*.mp3", "*.opus", "*.m4a", "*.flac", "*.mp4")
-FINGERPRINT_APPS = {"discord.exe"}
-
-def get_playing_apps(excluded=None):
-    playing = set()
-    excluded_set = set(e.lower() for e in (excluded or []))
+    global _last_saved_json
+    data = json.dumps(cfg, indent=2)
+    if data == _last_saved_json:
+        return
+    tmp = CONFIG_FILE + ".tmp"
+    with open(tmp, "w") as f:
+        f.write(data)
+    os.replace(tmp, CONFIG_FILE)
+    _last_saved_json = data
+
+OWN_PROCESSES = frozenset({"python.exe", "pythonw.exe", "py.exe", "python3.exe", "silenceplayer.exe"})
+SUPPORTED_EXTENSIONS = frozenset({".mp3", ".opus", ".m4a", ".flac", ".mp4"})
+FINGERPRINT_APPS = frozenset({"discord.exe"})
+
+# session instance id → (process name, IAudioMeterInformation, pid)
+# System sessions have no process and are cached as (None, None, None).
+_session_cache = {}
+AUDIO_SESSION_ACTIVE = 1   # pycaw.constants.AudioSessionState.Active
+# (session, name, meter, pid) for every app session, shared by the monitor
+# and the Discord watch thread so the two don't each enumerate
+_session_list  = ()
+_sessions_stamp = None
+# Set by invalidate_sessions, cleared as an enumeration starts, so a session
+# reported mid-enumeration still forces the next one
+_sessions_stale = True
+_session_lock  = threading.Lock()
+SESSION_REFRESH_SECS = 5.0
+
+def _cached_session(session):
+    key = session.InstanceIdentifier
+    cached = _session_cache.get(key)
+    if cached is None:
+        proc = session.Process
+        if proc is None:
+            cached = (None, None, None)
+        else:
+            from pycaw.pycaw import IAudioMeterInformation
+            name  = proc.name().casefold()
+            meter = session._ctl.QueryInterface(IAudioMeterInformation)
+            cached = (name, meter, proc.pid)
+        _session_cache[key] = cached
+    return key, cached
+
+def refresh_sessions(max_age):
+    """
+    Returns the shared (session, name, meter, pid) tuple, re-enumerating the
+    audio sessions first if the last enumeration is older than max_age.
+    """
+    global _session_list, _sessions_stamp, _sessions_stale
+    with _session_lock:
+        now = time.monotonic()
+        if (not _sessions_stale and _sessions_stamp is not None
+                and now - _sessions_stamp < max_age):
+            return _session_list
+        _sessions_stale = False
+        from pycaw.pycaw import AudioUtilities
+        seen = set()
+        sessions = []
+        for session in AudioUtilities.GetAllSessions():
+            try:
+                key, cached = _cached_session(session)
+            except Exception:
+                continue
+            seen.add(key)
+            if cached[0] is not None:
+                sessions.append((session,) + cached)
+        for key in _session_cache.keys() - seen:
+            del _session_cache[key]
+        _session_list  = tuple(sessions)
+        _sessions_stamp = now
+        return _session_list
+
+def invalidate_sessions():
+    """Makes the next refresh_sessions call re-enumerate."""
+    global _sessions_stale
+    _sessions_stale = True
+
+def get_blocked_apps(excluded):
+    """Returns the process names get_playing_apps should never report."""
+    return OWN_PROCESSES.union(e.casefold() for e in excluded)
+
+def get_playing_apps(blocked=OWN_PROCESSES, first_only=False, max_age=SESSION_REFRESH_SECS):
+    """
+    Returns the names of audible apps as a tuple, in session order. With
+    first_only, stops metering at the first audible app. Sessions are
+    re-enumerated once the shared list is older than max_age.
+    """
+    playing = {}
     try:
-        sessions = AudioUtilities.GetAllSessions()
-        for session in sessions:
-            if session.Process:
-                name = session.Process.name().lower()
-                if name in OWN_PROCESSES:
-                    continue
-                if name in excluded_set:
+        # Re-enumerating sessions is the costly COM call, so reuse the
+        # list between refreshes and only read the meters each poll
+        for session, name, meter, pid in refresh_sessions(max_age):
+            if name in blocked:
+                continue
+            try:
+                if session.State != AUDIO_SESSION_ACTIVE:
                     continue
-                try:
-                    meter = session._ctl.QueryInterface(IAudioMeterInformation)
-                    peak = meter.GetPeakValue()
-                    if peak > 0.001:
-                        playing.add(name)
-                except Exception:
-                    pass
+                if meter.GetPeakValue() > 0.001:
+                    playing[name] = None
+                    if first_only:
+                        break
+            except Exception:
+                # Session expired since the last refresh; re-enumerate next poll
+                invalidate_sessions()
     except Exception:
         pass
-    return playing
+    return tuple(playing)
+
+def init_com_mta():
+    """
+    Joins the calling thread to the multithreaded COM apartment, which
+    session notifications are delivered through. Returns the matching
+    CoUninitialize, or None if that failed.
+    """
+    try:
+        import comtypes
+        comtypes.CoInitializeEx(comtypes.COINIT_MULTITHREADED)
+    except Exception:
+        return None
+    return comtypes.CoUninitialize
+
+def watch_new_sessions(callback):
+    """
+    Calls callback() whenever Windows reports a new audio session, and
+    forces the next refresh_sessions to re-enumerate. Returns a function
+    that unregisters the watch, or None if notifications are unavailable.
+    """
+    try:
+        from pycaw.callbacks import AudioSessionNotification
+        from pycaw.pycaw import AudioUtilities
+    except ImportError:
+        return None
+
+    class _Notify(AudioSessionNotification):
+        def on_session_created(self, new_session):
+            invalidate_sessions()
+            callback()
+
+    try:
+        mgr = AudioUtilities.GetAudioSessionManager()
+        notify = _Notify()
+        mgr.RegisterSessionNotification(notify)
+        # The manager only starts notifying once sessions have been enumerated
+        mgr.GetSessionEnumerator()
+    except Exception:
+        return None
+
+    def unregister():
+        try:
+            mgr.UnregisterSessionNotification(notify)
+        except Exception:
+            pass
+    return unregister
+
+def get_playlist_files(folder):
+    """Returns the sorted paths of all supported audio files in folder."""
+    try:
+        with os.scandir(folder) as it:
+            # Skip dotfiles such as macOS ._ resource forks, as glob did
+            entries = [e for e in it
+                       if not e.name.startswith(".")
+                       and os.path.splitext(e.name)[1].lower() in SUPPORTED_EXTENSIONS
+                       and e.is_file()]
+    except OSError:
+        return []
+    entries.sort(key=lambda e: e.name.lower())
+    return [e.path for e in entries]
 
 def get_all_discord_pids():
     """Returns all unique PIDs associated with discord.exe audio sessions."""
-    pids = set()
     try:
-        sessions = AudioUtilities.GetAllSessions()
-        for session in sessions:
-            if session.Process:
-                if session.Process.name().lower() == "discord.exe":
-                    pids.add(session.Process.pid)
+        return {pid for session, name, meter, pid in refresh_sessions(1.0)
+                if name == "discord.exe"}
     except Exception:
-        pass
-    return pids
+        return set()
+
+@functools.lru_cache(maxsize=256)
+def ramp_volumes(start, end, steps):
+    """
+    Returns the volume for each of the steps + 1 linear ticks of a ramp
+    from start to end.
+    """
+    span = end - start
+    return tuple(start + int(span * i / steps) for i in range(steps + 1))
+
+@functools.lru_cache(maxsize=None)
+def ui_font(size, weight="normal"):
+    """Returns a shared named Segoe UI font; needs the Tk root to exist."""
+    from tkinter import font
+    return font.Font(family="Segoe UI", size=size, weight=weight)
 
+@functools.lru_cache(maxsize=None)
 def resource_path(filename):
     if hasattr(sys, '_MEIPASS'):
         return os.path.join(sys._MEIPASS, filename)
     return os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
 
+@functools.lru_cache(maxsize=None)
 def create_tray_icon():
+    from PIL import Image, ImageDraw
     try:
-        img = Image.open(resource_path("trayicon.png")).resize((64, 64))
+        img = Image.open(resource_path("trayicon.png"))
+        # The shipped icon is already 64x64; only resample replacements
+        if img.size != (64, 64):
+            img = img.resize((64, 64))
+        img.load()
         return img
     except Exception:
         img = Image.new("RGBA", (64, 64), (0, 0, 0, 0))
@@ -142,7 +310,8 @@ class DiscordMirrorFix:
         self._lock        = threading.Lock()
         self._running     = False
         self._taps        = {}   # pid → ProcessAudioCapture
-        self._rms_buffers = {}   # pid → deque of recent RMS values
+        self._rms_buffers = {}   # pid → [ring of recent RMS values, write count, ring sum]
+        self._rings       = ()   # snapshot of _rms_buffers.values() for lock-free reads
         self._watch_thread = None
 
     def start(self):
@@ -157,25 +326,44 @@ class DiscordMirrorFix:
             taps = dict(self._taps)
             self._taps.clear()
             self._rms_buffers.clear()
+            self._rings = ()
         for pid, tap in taps.items():
             try:
                 tap.stop()
             except Exception:
                 pass
 
-    def _make_callback(self, pid):
+    def _make_callback(self, ring):
+        # Each ring has exactly one writer, its tap's callback, so no lock is
+        # taken here; readers only ever see a slot or the count slightly stale
+        buf = ring[0]
+        size = self.WINDOW_SIZE
         def on_data(pcm, frames):
             try:
                 samples = np.frombuffer(pcm, dtype=np.float32)
-                rms = float(np.sqrt(np.mean(samples ** 2)))
-                with self._lock:
-                    if pid in self._rms_buffers:
-                        self._rms_buffers[pid].append(rms)
+                # dot() sums the squares without allocating a squared copy
+                n = samples.size
+                rms = math.sqrt(float(np.dot(samples, samples)) / n) if n else 0.0
+                count = ring[1]
+                i = count % size
+                total = ring[2] + rms - buf[i]
+                buf[i] = rms
+                # Re-sum exactly once per lap so float error can't accumulate
+                ring[2] = total if i else sum(buf)
+                ring[1] = count + 1
             except Exception:
                 pass
         return on_data
 
     def _watch_loop(self):
+        uninit = init_com_mta()
+        try:
+            self._watch()
+        finally:
+            if uninit:
+                uninit()
+
+    def _watch(self):
         while self._running:
             try:
                 current_pids = get_all_discord_pids()
@@ -186,13 +374,14 @@ class DiscordMirrorFix:
                 # Start taps for new PIDs
                 for pid in current_pids - existing_pids:
                     try:
+                        ring = [[0.0] * self.WINDOW_SIZE, 0, 0.0]
                         tap = ProcessAudioCapture(pid)
-                        tap.set_callback(self._make_callback(pid))
+                        tap.set_callback(self._make_callback(ring))
                         tap.start()
                         with self._lock:
                             self._taps[pid] = tap
-                            self._rms_buffers[pid] = collections.deque(
-                                maxlen=self.WINDOW_SIZE)
+                            self._rms_buffers[pid] = ring
+                            self._rings = tuple(self._rms_buffers.values())
                     except Exception:
                         pass
 
@@ -201,6 +390,7 @@ class DiscordMirrorFix:
                     with self._lock:
                         tap = self._taps.pop(pid, None)
                         self._rms_buffers.pop(pid, None)
+                        self._rings = tuple(self._rms_buffers.values())
                     if tap:
                         try:
                             tap.stop()
@@ -217,70 +407,175 @@ class DiscordMirrorFix:
         True  → at least one Discord session is outputting real audio → react
         False → all Discord sessions silent → mirroring only → ignore
         """
-        with self._lock:
-            if not self._rms_buffers:
-                return True  # No Discord sessions found → safe default
-            for pid, buf in self._rms_buffers.items():
-                if len(buf) < 3:
-                    continue
-                avg = float(np.mean(list(buf)))
-                if avg > self.REAL_AUDIO_THRESHOLD:
-                    return True
+        # The watcher swaps in a new tuple on every change, so one load is a
+        # consistent view and the audio callbacks never wait on this read
+        rings = self._rings
+        if not rings:
+            return True  # No Discord sessions found → safe default
+        for buf, count, total in rings:
+            n = min(count, self.WINDOW_SIZE)
+            if n < 3:
+                continue
+            # Unfilled slots are still 0.0, so total covers just the n written
+            if total / n > self.REAL_AUDIO_THRESHOLD:
+                return True
         return False
 
 
 class AudioMonitor:
+    """
+    Polls the audio sessions and drives the ambient player.
+
+    The poll interval backs off while nothing changes: 0.5s right after a
+    transition, 1.5s for the next 10s, 3s after that. Backing off is capped
+    at a tenth of the silence timeout, and skipped entirely while ambient
+    is audible so external audio still stops it promptly. In the last few
+    seconds of a countdown it polls every 0.25s so playback starts on time.
+    While ambient is audible the session list is re-enumerated every poll,
+    so an app that just started is never missed; otherwise a new audio
+    session wakes the loop and forces a refresh.
+    """
+
+    NEAR_INTERVAL   = 0.25
+    NEAR_WINDOW     = 3.0
+    FAST_INTERVAL   = 0.5
+    MEDIUM_INTERVAL = 1.5
+    SLOW_INTERVAL   = 3.0
+
+    SILENCE_COUNTDOWN = "Silence detected... playing in {}s"
+    UNDUCK_COUNTDOWN  = "Silence returned — fading back up in {}s"
+
     def __init__(self, app):
         self.app = app
         self.running = False
         self.thread = None
+        self._run_id = 0
+        self._last_countdown = None
+        self._wake = threading.Event()
 
     def start(self):
         self.running = True
-        self.thread = threading.Thread(target=self._monitor_loop, daemon=True)
+        self._last_countdown = None
+        self._wake.clear()
+        # A loop from an earlier start() may still be asleep; the new id retires it
+        self._run_id += 1
+        self.thread = threading.Thread(
+            target=self._monitor_loop, args=(self._run_id,), daemon=True)
         self.thread.start()
 
     def stop(self):
         self.running = False
+        self._wake.set()
+
+    def _emit(self, status, tray_title=None):
+        # Compared with what is on screen, so a message set elsewhere is
+        # still replaced by the next monitor update
+        if status != self.app._status:
+            self._last_countdown = None
+            self.app.set_status(status)
+            if tray_title:
+                self.app.set_tray_title(tray_title)
+
+    def _emit_countdown(self, template, remaining):
+        # Only format the message when the displayed second changes
+        countdown = (template, round(remaining))
+        if countdown != self._last_countdown:
+            self._emit(template.format(countdown[1]))
+            self._last_countdown = countdown
+
+    def _poll_interval(self, steady_for, silence_secs, audible, remaining=None):
+        if remaining is not None and remaining < self.NEAR_WINDOW:
+            # Land on the deadline itself instead of up to one tick past it
+            return max(0.01, min(self.NEAR_INTERVAL, remaining))
+        if audible or steady_for < 2.0:
+            return self.FAST_INTERVAL
+        if steady_for < 12.0:
+            interval = self.MEDIUM_INTERVAL
+        else:
+            interval = self.SLOW_INTERVAL
+        return min(interval, max(self.FAST_INTERVAL, silence_secs / 10))
 
-    def _monitor_loop(self):
+    def _monitor_loop(self, run_id):
+        uninit  = init_com_mta()
+        unwatch = watch_new_sessions(self._wake.set)
+        try:
+            self._poll(run_id)
+        finally:
+            if unwatch:
+                unwatch()
+            if uninit:
+                uninit()
+
+    def _poll(self, run_id):
         silence_start   = None
         ambient_triggered = False
         cooldown_until  = 0
         ducked          = False
         unduck_start    = None
-
-        self.app.set_status("Monitoring... waiting for silence.")
-
-        while self.running:
-            time.sleep(0.5)
-            silence_secs = float(self.app.config["silence_seconds"])
-            fade_enabled = self.app.config.get("fade_enabled", True)
-            fade_secs    = 2.0 if fade_enabled else 0.01
-            duck_percent = float(self.app.config.get("duck_percent", 0))
-            max_vol      = float(self.app.config["max_volume"])
-            excluded     = self.app.config.get("excluded_apps", [])
-            mirror_fix   = self.app.config.get("discord_mirror_fix", False)
-            now          = time.time()
-
-            raw_apps = get_playing_apps(excluded)
+        silence_secs    = self.app.config["silence_seconds"]
+        last_state      = None
+        state_since     = time.monotonic()
+        cfg_version     = None
+
+        self._emit("Monitoring... waiting for silence.", "Silence Player — Monitoring")
+
+        while self.running and run_id == self._run_id:
+            state = (ambient_triggered, ducked, silence_start is None)
+            now = time.monotonic()
+            if state != last_state:
+                last_state  = state
+                state_since = now
+            if not ambient_triggered and silence_start is not None:
+                remaining = silence_secs - (now - silence_start)
+            elif ducked and unduck_start is not None:
+                remaining = silence_secs - (now - unduck_start)
+            else:
+                remaining = None
+            self._wake.wait(self._poll_interval(
+                now - state_since, silence_secs,
+                ambient_triggered and not ducked, remaining))
+            if not self.running or run_id != self._run_id:
+                break
+            self._wake.clear()
+
+            # Config values only change from the UI; re-read them on a new version
+            if cfg_version != self.app.config_version:
+                cfg_version  = self.app.config_version
+                silence_secs = self.app.config["silence_seconds"]
+                fade_enabled = self.app.config.get("fade_enabled", True)
+                fade_secs    = 2.0 if fade_enabled else 0.01
+                duck_percent = self.app.config["duck_percent"]
+                max_vol      = self.app.config["max_volume"]
+                mirror_fix   = self.app.config.get("discord_mirror_fix", False)
+                duck_status  = (f"External audio detected — "
+                                f"ambient ducked to {duck_percent}%.")
+            now = time.monotonic()
+
+            # While ducked the status doesn't name the apps, so any one will do;
+            # the mirror fix still needs them all to filter Discord out. A stale
+            # session list would let ambient play over a new app.
+            raw_apps = get_playing_apps(
+                self.app.blocked_apps,
+                first_only=ducked and duck_percent != 0 and not mirror_fix,
+                max_age=0 if ambient_triggered else SESSION_REFRESH_SECS)
 
             # Apply Discord mirror fix
             if mirror_fix and self.app.discord_fix:
-                current_apps = set()
+                current_apps = []
                 for name in raw_apps:
                     if name in FINGERPRINT_APPS:
                         # Only include Discord if it's playing real audio
                         if self.app.discord_fix.is_real_discord_audio():
-                            current_apps.add(name)
+                            current_apps.append(name)
                     else:
-                        current_apps.add(name)
+                        current_apps.append(name)
+                current_apps = tuple(current_apps)
             else:
                 current_apps = raw_apps
 
             if ambient_triggered:
                 if now < cooldown_until:
-                    self.app.set_status("Playing ambient sound...")
+                    self._emit("Playing ambient sound...", "Silence Player — Playing ambient")
                     continue
 
                 if not self.app.player.playing and not ducked:
@@ -296,20 +591,18 @@ class AudioMonitor:
                         self.app.stop_ambient()
                         ambient_triggered = False
                         silence_start = None
-                        self.app.set_status(
-                            f"External audio detected ({', '.join(current_apps)}) — ambient stopped.")
+                        self._emit(
+                            f"External audio detected ({', '.join(current_apps)}) — ambient stopped.",
+                            "Silence Player — Monitoring")
                     else:
                         if not ducked:
                             ducked = True
                             unduck_start = None
                             duck_vol = (duck_percent / 100.0) * max_vol
                             self.app.duck_ambient(duck_vol)
-                            self.app.set_status(
-                                f"External audio detected — ambient ducked to {int(duck_percent)}%.")
                         else:
                             unduck_start = None
-                            self.app.set_status(
-                                f"External audio detected — ambient ducked to {int(duck_percent)}%.")
+                        self._emit(duck_status, "Silence Player — Ambient ducked")
                 else:
                     if ducked:
                         if unduck_start is None:
@@ -317,19 +610,18 @@ class AudioMonitor:
                         elapsed = now - unduck_start
                         remaining = silence_secs - elapsed
                         if remaining > 0:
-                            self.app.set_status(
-                                f"Silence returned — fading back up in {remaining:.0f}s")
+                            self._emit_countdown(self.UNDUCK_COUNTDOWN, remaining)
                         else:
                             ducked = False
                             unduck_start = None
                             self.app.unduck_ambient(max_vol)
-                            self.app.set_status("Playing ambient sound...")
+                            self._emit("Playing ambient sound...", "Silence Player — Playing ambient")
                     else:
-                        self.app.set_status("Playing ambient sound...")
+                        self._emit("Playing ambient sound...", "Silence Player — Playing ambient")
             else:
                 if current_apps:
                     silence_start = None
-                    self.app.set_status(
+                    self._emit(
                         f"Audio playing ({', '.join(current_apps)}). Monitoring...")
                 else:
                     if silence_start is None:
@@ -343,8 +635,7 @@ class AudioMonitor:
                         self.app.play_ambient()
                     else:
                         remaining = silence_secs - elapsed
-                        self.app.set_status(
-                            f"Silence detected... playing in {remaining:.0f}s")
+                        self._emit_countdown(self.SILENCE_COUNTDOWN, remaining)
 
 
 class AmbientPlayer:
@@ -354,156 +645,254 @@ class AmbientPlayer:
         self.saved_pos = 0.0
         self.playlist = []
         self.playlist_index = 0
+        self._playlist_cache = None
         self._current_vol = 0
+        self._ramp_gen = 0
+        self._play_gen = 0
+        self._state_lock = threading.Lock()
         self._stop_event = threading.Event()
-        self.vlc_instance = vlc.Instance("--quiet", "--no-video")
-        self.media_player = self.vlc_instance.media_player_new()
+        self._playing_event = threading.Event()
+        self._song_end = threading.Event()
+        self._vlc_lock = threading.Lock()
+        self.vlc_instance = None
+        self.media_player = None
+
+    def _ensure_vlc(self):
+        """
+        Creates the libvlc instance on first playback. Loading libvlc and
+        its plugin cache is the slowest part of startup, and most of the
+        time the app only monitors.
+        """
+        with self._vlc_lock:
+            if self.media_player is not None:
+                return
+            import vlc
+            self.vlc_instance = vlc.Instance("--quiet", "--no-video")
+            self.media_player = self.vlc_instance.media_player_new()
+            events = self.media_player.event_manager()
+            events.event_attach(vlc.EventType.MediaPlayerPlaying, self._on_vlc_playing)
+            for kind in (vlc.EventType.MediaPlayerEndReached,
+                         vlc.EventType.MediaPlayerEncounteredError):
+                events.event_attach(kind, self._on_vlc_end)
+
+    def _on_vlc_playing(self, event):
+        self._playing_event.set()
+
+    def _on_vlc_end(self, event):
+        self._song_end.set()
+
+    def _wait_song_end(self):
+        # The 5s re-check only backs up a missed libvlc event
+        while not self._song_end.wait(5.0):
+            if not self._is_playing():
+                break
 
     def _get_fade_secs(self):
         return 2.0 if self.app.config.get("fade_enabled", True) else 0.01
 
     def _set_volume(self, vol_percent):
         vol = max(0, min(100, int(vol_percent)))
+        if vol == self._current_vol:
+            return
         self._current_vol = vol
         self.media_player.audio_set_volume(vol)
 
     def _get_volume(self):
+        if self.media_player is None:
+            return self._current_vol
         return self.media_player.audio_get_volume()
 
     def _is_playing(self):
         return self.media_player.is_playing()
 
-    def _fade_in(self, target_vol):
-        fade_secs = self._get_fade_secs()
-        steps = 50
-        step_time = fade_secs / steps
-        self._set_volume(0)
-        for i in range(steps + 1):
-            if not self.playing or self._stop_event.is_set():
+    def _ramp(self, start, end, secs, steps, active, wake=None):
+        """
+        Moves the volume from start to end over secs along ramp_volumes().
+        Ticks follow the monotonic clock, so late wakeups skip ticks instead
+        of stretching the ramp.
+        Stops early and returns False as soon as active() is falsy or a
+        newer ramp has started. If wake is given, the ramp sleeps on that
+        event so setting it is noticed immediately.
+        """
+        # A ramp that would not run must not cancel the one in progress
+        if not active():
+            return False
+        self._ramp_gen += 1
+        gen = self._ramp_gen
+        start = max(0, min(100, int(start)))
+        end   = max(0, min(100, int(end)))
+        vols = ramp_volumes(start, end, steps)
+        step_time = secs / steps
+        t0 = time.monotonic()
+        while True:
+            if gen != self._ramp_gen or not active():
                 return False
-            self._set_volume((i / steps) * target_vol)
-            time.sleep(step_time)
-        return True
+            now = time.monotonic()
+            tick = min(steps, int((now - t0) / step_time))
+            self._set_volume(vols[tick])
+            if tick == steps:
+                return True
+            delay = t0 + (tick + 1) * step_time - now
+            if wake is None:
+                time.sleep(delay)
+            else:
+                wake.wait(delay)
+
+    def _active(self):
+        return self.playing and not self._stop_event.is_set()
+
+    def _current(self, gen):
+        # A worker left over from before a quick stop/play must not carry on
+        return gen == self._play_gen and self._active()
+
+    def _finish(self, gen):
+        with self._state_lock:
+            if gen == self._play_gen:
+                self.playing = False
+
+    def _fade_in(self, target_vol):
+        self._ramp(0, target_vol, self._get_fade_secs(), 50,
+                   self._active, self._stop_event)
+        # A duck that supersedes the fade is not a stop
+        return self._active()
 
     def _fade_out(self):
-        fade_secs = self._get_fade_secs()
-        steps = 50
-        step_time = fade_secs / steps
-        current = self._get_volume()
-        for i in range(steps):
-            if not self._is_playing():
-                break
-            self._set_volume(current * (1 - (i / steps)))
-            time.sleep(step_time)
-        self.media_player.stop()
+        # stop() sets _stop_event before fading out, so don't wake on it here
+        self._ramp(self._get_volume(), 0, self._get_fade_secs(), 50,
+                   self._is_playing)
+        # A play() that arrived mid-fade owns the player now
+        if not self.playing:
+            self.media_player.stop()
 
     def duck(self, target_vol):
         try:
-            current = self._get_volume()
-            for i in range(21):
-                if not self.playing:
-                    return
-                self._set_volume(current + (target_vol - current) * (i / 20))
-                time.sleep(0.05)
+            self._ramp(self._get_volume(), target_vol, 1.0, 20,
+                       self._active, self._stop_event)
         except Exception:
             pass
 
     def unduck(self, target_vol):
         try:
-            current = self._get_volume()
-            fade_secs = self._get_fade_secs()
-            steps = 50
-            step_time = fade_secs / steps
-            for i in range(steps + 1):
-                if not self.playing:
-                    return
-                self._set_volume(current + (target_vol - current) * (i / steps))
-                time.sleep(step_time)
+            self._ramp(self._get_volume(), target_vol, self._get_fade_secs(), 50,
+                       self._active, self._stop_event)
         except Exception:
             pass
 
     def play(self, config):
-        if self.playing:
-            return
-        self.playing = True
-        self._stop_event.clear()
+        with self._state_lock:
+            if self.playing:
+                return
+            try:
+                self._ensure_vlc()
+            except Exception as e:
+                # Runs on the monitor thread; leaving playing False lets the
+                # monitor wind down instead of dying with the exception
+                self.app.set_status(f"Playback error: {e}", error=True)
+                return
+            self.playing = True
+            self._play_gen += 1
+            gen = self._play_gen
+            self._stop_event.clear()
         mode = config.get("mode", "single")
 
         if mode == "single":
             path = config.get("mp3_path", "")
             loop_mode = config.get("single_loop_mode", "loop")
             if not path or not os.path.exists(path):
+                self._finish(gen)
                 self.app.set_status("No valid audio file selected!", error=True)
-                self.playing = False
                 return
             threading.Thread(
                 target=self._play_single,
-                args=(path, config["max_volume"], loop_mode),
+                args=(gen, path, config["max_volume"], loop_mode),
                 daemon=True).start()
         else:
             folder = config.get("playlist_folder", "")
             if not folder or not os.path.isdir(folder):
+                self._finish(gen)
                 self.app.set_status("No valid playlist folder selected!", error=True)
-                self.playing = False
                 return
-            files = []
-            for ext in SUPPORTED_EXTENSIONS:
-                files.extend(glob.glob(os.path.join(folder, ext)))
-            files = sorted(files)
+            files = self._list_playlist(folder)
             if not files:
+                self._finish(gen)
                 self.app.set_status("No supported audio files found in folder!", error=True)
-                self.playing = False
                 return
             self.playlist = files
             self.playlist_index = 0
             threading.Thread(
                 target=self._play_playlist,
-                args=(config["max_volume"], config.get("playlist_loop_mode", "loop_playlist")),
+                args=(gen, config["max_volume"],
+                      config.get("playlist_loop_mode", "loop_playlist")),
                 daemon=True).start()
 
-    def _load_and_play(self, path, start_pos=0.0):
+    def _list_playlist(self, folder):
+        # Adding, removing or renaming a file bumps the folder's mtime
+        try:
+            mtime = os.stat(folder).st_mtime
+        except OSError:
+            return []
+        cache = self._playlist_cache
+        if cache and cache[0] == folder and cache[1] == mtime:
+            return cache[2]
+        files = get_playlist_files(folder)
+        self._playlist_cache = (folder, mtime, files)
+        return files
+
+    def _load_and_play(self, path, start_pos=0.0, repeat=False):
         media = self.vlc_instance.media_new(path)
+        if repeat:
+            # Let libvlc restart the input itself instead of reopening it
+            media.add_option(":input-repeat=65535")
         self.media_player.set_media(media)
+        # libvlc can reset the output volume on a new input; force the next write
+        self._current_vol = None
+        self._playing_event.clear()
+        self._song_end.clear()
         self.media_player.play()
-        for _ in range(20):
-            time.sleep(0.1)
-            if self.media_player.is_playing():
-                break
+        self._playing_event.wait(timeout=2.0)
         if start_pos > 0.5:
             self.media_player.set_time(int(start_pos * 1000))
 
-    def _play_single(self, path, max_vol, loop_mode):
+    def _play_single(self, gen, path, max_vol, loop_mode):
         try:
-            self._load_and_play(path, self.saved_pos)
+            self._load_and_play(path, self.saved_pos, repeat=(loop_mode == "loop"))
             self.saved_pos = 0.0
             if not self._fade_in(max_vol):
                 return
             if loop_mode == "loop":
-                while self.playing and not self._stop_event.is_set():
-                    if not self._is_playing():
-                        self._load_and_play(path, 0.0)
-                        self._set_volume(max_vol)
-                    time.sleep(0.3)
+                # libvlc repeats the input itself; an end means it gave up
+                # (decode error, file gone, repeats used up), so reopen it
+                while True:
+                    self._wait_song_end()
+                    if not self._current(gen):
+                        return
+                    if not os.path.exists(path):
+                        self._finish(gen)
+                        return
+                    vol = self._current_vol
+                    self._load_and_play(path, 0.0, repeat=True)
+                    self._set_volume(max_vol if vol is None else vol)
             else:
-                while self.playing and not self._stop_event.is_set():
-                    if not self._is_playing():
-                        break
-                    time.sleep(0.3)
-                self.playing = False
+                self._wait_song_end()
+                self._finish(gen)
         except Exception as e:
+            self._finish(gen)
             self.app.set_status(f"Playback error: {e}", error=True)
-            self.playing = False
 
-    def _play_playlist(self, max_vol, loop_mode):
+    def _play_playlist(self, gen, max_vol, loop_mode):
         try:
             first_song = True
-            while self.playing and not self._stop_event.is_set():
-                loop_mode = self.app.config["playlist_loop_mode"]
+            cfg_version = self.app.config_version
+            while self._current(gen):
+                # The toggle only changes through _set_config, which bumps the version
+                if cfg_version != self.app.config_version:
+                    cfg_version = self.app.config_version
+                    loop_mode = self.app.config["playlist_loop_mode"]
                 if self.playlist_index >= len(self.playlist):
                     if loop_mode == "loop_playlist":
                         self.playlist_index = 0
                     else:
-                        self.playing = False
+                        self._finish(gen)
                         break
                 path = self.playlist[self.playlist_index]
                 self.app.set_status(f"Playing: {os.path.basename(path)}")
@@ -512,34 +901,35 @@ class AmbientPlayer:
                 first_song = False
                 if not self._fade_in(max_vol):
                     return
-                while self.playing and not self._stop_event.is_set():
-                    if not self._is_playing():
-                        break
-                    time.sleep(0.3)
-                if not self.playing or self._stop_event.is_set():
+                self._wait_song_end()
+                if not self._current(gen):
                     return
-                current_mode = self.app.config["playlist_loop_mode"]
-                if current_mode == "loop_song":
+                if cfg_version != self.app.config_version:
+                    cfg_version = self.app.config_version
+                    loop_mode = self.app.config["playlist_loop_mode"]
+                if loop_mode == "loop_song":
                     self._load_and_play(path, 0.0)
                     self._set_volume(max_vol)
-                elif current_mode == "stop":
-                    self.playing = False
+                elif loop_mode == "stop":
+                    self._finish(gen)
                     break
                 else:
                     self.playlist_index += 1
         except Exception as e:
+            self._finish(gen)
             self.app.set_status(f"Playback error: {e}", error=True)
-            self.playing = False
 
     def stop(self):
-        if not self.playing:
-            return
-        try:
-            self.saved_pos = self.media_player.get_time() / 1000.0
-        except Exception:
-            self.saved_pos = 0.0
-        self._stop_event.set()
-        self.playing = False
+        with self._state_lock:
+            if not self.playing:
+                return
+            try:
+                self.saved_pos = self.media_player.get_time() / 1000.0
+            except Exception:
+                self.saved_pos = 0.0
+            self._stop_event.set()
+            self._song_end.set()
+            self.playing = False
         try:
             self._fade_out()
         except Exception:
@@ -547,6 +937,13 @@ class AmbientPlayer:
 
 
 class App:
+    _EXE_SUFFIXES    = (".exe",)
+    _AUDIO_FILETYPES = (("Audio files", " ".join("*" + e for e in sorted(SUPPORTED_EXTENSIONS))),
+                        ("All files", "*.*"))
+    _DUCK_LABELS     = tuple("Stop (0%)" if i == 0 else
+                             "Keep Playing (100%)" if i == 100 else
+                             f"Duck to {i}%" for i in range(101))
+
     def __init__(self, root):
         self.root = root
         self.root.title("Silence Player")
@@ -560,14 +957,31 @@ class App:
         except Exception:
             pass
 
-        self.config      = load_config()
-        self.monitor     = AudioMonitor(self)
-        self.player      = AmbientPlayer(self)
-        self.discord_fix = None
-        self.monitoring  = False
-        self._status     = "Ready."
-        self.tray        = None
-
+        self.config         = load_config()
+        self._config_dirty  = False
+        self._save_after_id = None
+        self._save_q        = queue.Queue(maxsize=1)
+        self._path_cache    = {}   # config key → (path, ok, checked_at)
+        self._duck_q        = queue.Queue()  # (player method, target volume) or None
+        self.config_version = 0
+        self.blocked_apps   = get_blocked_apps(self.config.get("excluded_apps", []))
+        # Ordered list + set are the source of truth; the Listbox is only a view
+        self._excluded      = list(dict.fromkeys(self.config.get("excluded_apps", [])))
+        self._excluded_set  = set(self._excluded)
+        self.monitor        = AudioMonitor(self)
+        self.player         = AmbientPlayer(self)
+        self.discord_fix    = None
+        self.monitoring     = False
+        self._status        = "Ready."
+        self._status_pending = False
+        self._closing       = False
+        self._duck_after_id = None
+        self.tray           = None
+        self._tray_title    = "Silence Player"
+
+        self._save_thread = threading.Thread(target=self._save_loop, daemon=True)
+        self._save_thread.start()
+        threading.Thread(target=self._duck_loop, daemon=True).start()
         self._build_ui()
         threading.Thread(target=self._build_tray, daemon=True).start()
         self._start_monitoring()
@@ -585,14 +999,14 @@ class App:
             threading.Thread(target=fix.stop, daemon=True).start()
 
     def _build_tray(self):
-        icon_image = create_tray_icon()
+        import pystray
         menu = pystray.Menu(
             pystray.MenuItem("Open Settings", self._tray_open, default=True),
             pystray.MenuItem("Stop Monitoring", self._tray_toggle),
             pystray.Menu.SEPARATOR,
             pystray.MenuItem("Quit", self._tray_quit),
         )
-        self.tray = pystray.Icon("SilencePlayer", icon_image, "Silence Player", menu)
+        self.tray = pystray.Icon("SilencePlayer", create_tray_icon(), self._tray_title, menu)
         self.tray.run()
 
     def _tray_open(self, icon=None, item=None):
@@ -602,10 +1016,15 @@ class App:
         self.root.after(0, self._toggle_monitoring)
 
     def _tray_quit(self, icon=None, item=None):
+        if self._closing:
+            return
+        self._closing = True
         self.monitor.stop()
         self.player.stop()
         self._stop_discord_fix()
-        save_config(self.config)
+        self._save_config()
+        self._stop_save_thread()
+        self._duck_q.put(None)
         if self.tray:
             self.tray.stop()
         self.root.after(0, self.root.destroy)
@@ -616,7 +1035,7 @@ class App:
         self.root.focus_force()
 
     def _hide_window(self):
-        save_config(self.config)
+        self._flush_config()
         self.root.withdraw()
 
     def _build_ui(self):
@@ -629,17 +1048,22 @@ class App:
 
         def label(parent, text, size=10, bold=False, color=FG):
             return tk.Label(parent, text=text, bg=parent["bg"], fg=color,
-                            font=("Segoe UI", size, "bold" if bold else "normal"))
-
-        def entry(parent, textvariable, width=24):
-            return tk.Entry(parent, textvariable=textvariable, width=width,
-                            bg=BTN_BG, fg=FG, insertbackground=FG,
-                            relief="flat", font=("Segoe UI", 10), bd=6)
+                            font=ui_font(size, "bold") if bold else ui_font(size))
+
+        def entry(parent, value, width=24, **kw):
+            # Filled before kw is applied so a validatecommand never sees the initial value
+            e = tk.Entry(parent, width=width,
+                         bg=BTN_BG, fg=FG, insertbackground=FG,
+                         relief="flat", font=ui_font(10), bd=6)
+            e.insert(0, value)
+            if kw:
+                e.config(**kw)
+            return e
 
         def button(parent, text, command, color=ACC):
             return tk.Button(parent, text=text, command=command,
                              bg=BTN_BG, fg=color, relief="flat",
-                             font=("Segoe UI", 10, "bold"),
+                             font=ui_font(10, "bold"),
                              padx=8, pady=5, cursor="hand2",
                              activebackground="#45475a", activeforeground=color)
 
@@ -654,68 +1078,72 @@ class App:
         self.tab_advanced = tk.Frame(self.root, bg=BG)
 
         def switch_tab(tab):
-            self.tab_main.pack_forget()
-            self.tab_exclude.pack_forget()
-            self.tab_advanced.pack_forget()
-            self.tab_btn_main.config(bg=BTN_BG, fg=DIM)
-            self.tab_btn_exclude.config(bg=BTN_BG, fg=DIM)
-            self.tab_btn_advanced.config(bg=BTN_BG, fg=DIM)
-            if tab == "main":
-                self.tab_main.pack(fill="both", expand=True)
-                self.tab_btn_main.config(bg=ACC, fg="#1e1e2e")
-            elif tab == "exclude":
-                self.tab_exclude.pack(fill="both", expand=True)
-                self.tab_btn_exclude.config(bg=ACC, fg="#1e1e2e")
-            else:
-                self.tab_advanced.pack(fill="both", expand=True)
-                self.tab_btn_advanced.config(bg=ACC, fg="#1e1e2e")
+            build = self._tab_builders.pop(tab, None)
+            if build:
+                build()
+            shown = None
+            for name, frame, btn in (("main",     self.tab_main,     self.tab_btn_main),
+                                     ("exclude",  self.tab_exclude,  self.tab_btn_exclude),
+                                     ("advanced", self.tab_advanced, self.tab_btn_advanced)):
+                if name == tab:
+                    shown = frame
+                    btn.config(bg=ACC, fg="#1e1e2e")
+                else:
+                    frame.pack_forget()
+                    btn.config(bg=BTN_BG, fg=DIM)
+            shown.pack(fill="both", expand=True)
 
         self.tab_btn_main = tk.Button(tab_bar, text="Settings",
-                                      command=lambda: switch_tab("main"),
-                                      relief="flat", font=("Segoe UI", 10, "bold"),
+                                      command=functools.partial(switch_tab, "main"),
+                                      relief="flat", font=ui_font(10, "bold"),
                                       padx=16, pady=5, cursor="hand2",
                                       bg=ACC, fg="#1e1e2e")
         self.tab_btn_main.pack(side="left", padx=3)
 
         self.tab_btn_exclude = tk.Button(tab_bar, text="Exclude Apps",
-                                         command=lambda: switch_tab("exclude"),
-                                         relief="flat", font=("Segoe UI", 10, "bold"),
+                                         command=functools.partial(switch_tab, "exclude"),
+                                         relief="flat", font=ui_font(10, "bold"),
                                          padx=16, pady=5, cursor="hand2",
                                          bg=BTN_BG, fg=DIM)
         self.tab_btn_exclude.pack(side="left", padx=3)
 
         self.tab_btn_advanced = tk.Button(tab_bar, text="Advanced",
-                                          command=lambda: switch_tab("advanced"),
-                                          relief="flat", font=("Segoe UI", 10, "bold"),
+                                          command=functools.partial(switch_tab, "advanced"),
+                                          relief="flat", font=ui_font(10, "bold"),
                                           padx=16, pady=5, cursor="hand2",
                                           bg=BTN_BG, fg=DIM)
         self.tab_btn_advanced.pack(side="left", padx=3)
 
         self._build_main_tab(self.tab_main, BG, CARD, FG, ACC, BTN_BG, DIM, label, entry, button)
-        self._build_exclude_tab(self.tab_exclude, BG, CARD, FG, ACC, BTN_BG, DIM)
-        self._build_advanced_tab(self.tab_advanced, BG, CARD, FG, ACC, BTN_BG, DIM)
+        # Built on first view; most sessions never open these tabs
+        self._tab_builders = {
+            "exclude":  functools.partial(self._build_exclude_tab,
+                                          self.tab_exclude, BG, CARD, FG, ACC, BTN_BG, DIM),
+            "advanced": functools.partial(self._build_advanced_tab,
+                                          self.tab_advanced, BG, CARD, FG, ACC, BTN_BG, DIM),
+        }
+        if self.config.get("discord_mirror_fix", False):
+            self._start_discord_fix()
 
         self.tab_main.pack(fill="both", expand=True)
 
         self.status_var = tk.StringVar(value=self._status)
         tk.Label(self.root, textvariable=self.status_var,
                  bg="#181825", fg=DIM,
-                 font=("Segoe UI", 9), pady=8, wraplength=500).pack(fill="x", side="bottom")
+                 font=ui_font(9), pady=8, wraplength=500).pack(fill="x", side="bottom")
 
     def _build_main_tab(self, parent, BG, CARD, FG, ACC, BTN_BG, DIM, label, entry, button):
         mode_frame = tk.Frame(parent, bg=BG)
         mode_frame.pack(pady=(8, 0))
         label(mode_frame, "Mode:", bold=True).pack(side="left", padx=(0, 8))
 
-        self.mode_var = tk.StringVar(value=self.config.get("mode", "single"))
+        def set_mode(val):
+            self._set_config("mode", val)
+            _refresh_mode()
 
         def mode_btn(text, val):
-            def on_click():
-                self.mode_var.set(val)
-                self.config["mode"] = val
-                _refresh_mode()
-            b = tk.Button(mode_frame, text=text, command=on_click,
-                          relief="flat", font=("Segoe UI", 10, "bold"),
+            b = tk.Button(mode_frame, text=text, command=functools.partial(set_mode, val),
+                          relief="flat", font=ui_font(10, "bold"),
                           padx=12, pady=5, cursor="hand2")
             b.pack(side="left", padx=3)
             return b
@@ -724,8 +1152,7 @@ class App:
         self.btn_playlist = mode_btn("Playlist",    "playlist")
 
         def _refresh_mode():
-            m = self.mode_var.get()
-            if m == "single":
+            if self.config.get("mode", "single") == "single":
                 self.btn_single.config(bg=ACC, fg="#1e1e2e")
                 self.btn_playlist.config(bg=BTN_BG, fg=DIM)
                 single_card.pack(fill="x", padx=24, pady=(8, 4))
@@ -739,84 +1166,78 @@ class App:
         single_card = tk.Frame(parent, bg=CARD, padx=16, pady=12)
         label(single_card, "Ambient Sound File (MP3, OPUS, M4A, FLAC, MP4)", bold=True).grid(
             row=0, column=0, columnspan=3, sticky="w", pady=(0, 4))
-        self.mp3_var = tk.StringVar(value=self.config["mp3_path"])
-        entry(single_card, self.mp3_var, width=22).grid(row=1, column=0, sticky="w")
+        self.mp3_entry = entry(single_card, self.config["mp3_path"], width=22)
+        self.mp3_entry.grid(row=1, column=0, sticky="w")
         button(single_card, "Browse", self._browse_mp3).grid(row=1, column=1, padx=(6, 10))
 
-        self.single_loop_var = tk.StringVar(value=self.config.get("single_loop_mode", "loop"))
         single_toggle_frame = tk.Frame(single_card, bg=CARD)
         single_toggle_frame.grid(row=1, column=2, sticky="w")
 
-        def make_single_toggle(text, val):
-            def on_click():
-                self.single_loop_var.set(val)
-                self.config["single_loop_mode"] = val
-                _refresh_single_toggle()
-            b = tk.Button(single_toggle_frame, text=text, command=on_click,
-                          relief="flat", font=("Segoe UI", 9, "bold"),
-                          padx=8, pady=4, cursor="hand2")
-            b.pack(side="left", padx=2)
-            return b
+        def toggle_group(frame, key, default, options):
+            # Only the buttons leaving and entering the active state are recoloured
+            buttons = {}
+            active  = [None]
 
-        self.s_btn_loop = make_single_toggle("Loop", "loop")
-        self.s_btn_stop = make_single_toggle("Stop", "stop")
-
-        def _refresh_single_toggle():
-            v = self.single_loop_var.get()
-            self.s_btn_loop.config(bg=ACC if v == "loop" else BTN_BG,
-                                   fg="#1e1e2e" if v == "loop" else DIM)
-            self.s_btn_stop.config(bg="#f38ba8" if v == "stop" else BTN_BG,
-                                   fg="#1e1e2e" if v == "stop" else DIM)
-
-        _refresh_single_toggle()
+            def select(val):
+                # Hand-edited or older configs may hold a value with no button
+                if val == active[0] or val not in buttons:
+                    return
+                if active[0] in buttons:
+                    buttons[active[0]][0].config(bg=BTN_BG, fg=DIM)
+                b, color = buttons[val]
+                b.config(bg=color, fg="#1e1e2e")
+                active[0] = val
+
+            def on_click(val):
+                self._set_config(key, val)
+                select(val)
+
+            for text, val, color in options:
+                b = tk.Button(frame, text=text, command=functools.partial(on_click, val),
+                              relief="flat", font=ui_font(9, "bold"),
+                              padx=8, pady=4, cursor="hand2", bg=BTN_BG, fg=DIM)
+                b.pack(side="left", padx=2)
+                buttons[val] = (b, color)
+            select(self.config.get(key, default))
+            return {val: b for val, (b, color) in buttons.items()}
+
+        single_btns = toggle_group(single_toggle_frame, "single_loop_mode", "loop",
+                                   (("Loop", "loop", ACC),
+                                    ("Stop", "stop", "#f38ba8")))
+        self.s_btn_loop = single_btns["loop"]
+        self.s_btn_stop = single_btns["stop"]
 
         playlist_card = tk.Frame(parent, bg=CARD, padx=16, pady=12)
         label(playlist_card, "Ambient Sound Playlist (Folder)", bold=True).grid(
             row=0, column=0, columnspan=3, sticky="w", pady=(0, 4))
-        self.playlist_var = tk.StringVar(value=self.config.get("playlist_folder", ""))
-        entry(playlist_card, self.playlist_var, width=22).grid(row=1, column=0, sticky="w")
+        self.playlist_entry = entry(playlist_card, self.config.get("playlist_folder", ""), width=22)
+        self.playlist_entry.grid(row=1, column=0, sticky="w")
         button(playlist_card, "Browse", self._browse_playlist).grid(row=1, column=1, padx=(6, 10))
 
-        self.playlist_loop_var = tk.StringVar(value=self.config.get("playlist_loop_mode", "loop_playlist"))
         playlist_toggle_frame = tk.Frame(playlist_card, bg=CARD)
         playlist_toggle_frame.grid(row=1, column=2, sticky="w")
 
-        def make_playlist_toggle(text, val):
-            def on_click():
-                self.playlist_loop_var.set(val)
-                self.config["playlist_loop_mode"] = val
-                _refresh_playlist_toggle()
-            b = tk.Button(playlist_toggle_frame, text=text, command=on_click,
-                          relief="flat", font=("Segoe UI", 9, "bold"),
-                          padx=8, pady=4, cursor="hand2")
-            b.pack(side="left", padx=2)
-            return b
-
-        self.p_btn_loop_song = make_playlist_toggle("Loop Song",     "loop_song")
-        self.p_btn_stop      = make_playlist_toggle("Stop",          "stop")
-        self.p_btn_loop_pl   = make_playlist_toggle("Loop Playlist", "loop_playlist")
-
-        def _refresh_playlist_toggle():
-            v = self.playlist_loop_var.get()
-            self.p_btn_loop_song.config(bg=ACC if v == "loop_song" else BTN_BG,
-                                        fg="#1e1e2e" if v == "loop_song" else DIM)
-            self.p_btn_stop.config(bg="#f38ba8" if v == "stop" else BTN_BG,
-                                   fg="#1e1e2e" if v == "stop" else DIM)
-            self.p_btn_loop_pl.config(bg="#a6e3a1" if v == "loop_playlist" else BTN_BG,
-                                      fg="#1e1e2e" if v == "loop_playlist" else DIM)
-
-        _refresh_playlist_toggle()
+        playlist_btns = toggle_group(playlist_toggle_frame, "playlist_loop_mode", "loop_playlist",
+                                     (("Loop Song",     "loop_song",     ACC),
+                                      ("Stop",          "stop",          "#f38ba8"),
+                                      ("Loop Playlist", "loop_playlist", "#a6e3a1")))
+        self.p_btn_loop_song = playlist_btns["loop_song"]
+        self.p_btn_stop      = playlist_btns["stop"]
+        self.p_btn_loop_pl   = playlist_btns["loop_playlist"]
 
         shared_card = tk.Frame(parent, bg=CARD, padx=16, pady=12)
         shared_card.pack(fill="x", padx=24, pady=4)
 
-        self.silence_var = tk.StringVar(value=str(self.config["silence_seconds"]))
-        self.vol_var     = tk.StringVar(value=str(self.config["max_volume"]))
+        validate_range = self.root.register(self._validate_range)
 
         label(shared_card, "Silence Timeout (seconds)", bold=True).grid(row=0, column=0, sticky="w")
         label(shared_card, "Max Volume (0-100)",         bold=True).grid(row=0, column=1, sticky="w", padx=(20, 0))
-        entry(shared_card, self.silence_var, width=12).grid(row=1, column=0, sticky="w", pady=(2, 8))
-        entry(shared_card, self.vol_var,     width=12).grid(row=1, column=1, sticky="w", padx=(20, 0), pady=(2, 8))
+        self.silence_entry = entry(shared_card, self.config["silence_seconds"], width=12,
+                                   validate="key", validatecommand=(validate_range, "%P", 3600))
+        self.silence_entry.grid(row=1, column=0, sticky="w", pady=(2, 8))
+        self.vol_entry = entry(shared_card, self.config["max_volume"], width=12,
+                               validate="key", validatecommand=(validate_range, "%P", 100))
+        self.vol_entry.grid(row=1, column=1, sticky="w", padx=(20, 0), pady=(2, 8))
 
         fade_row = tk.Frame(shared_card, bg=CARD)
         fade_row.grid(row=2, column=0, columnspan=2, sticky="w", pady=(4, 0))
@@ -824,22 +1245,23 @@ class App:
 
         self.fade_enabled_var = tk.BooleanVar(value=self.config.get("fade_enabled", True))
 
-        def toggle_fade():
-            v = self.fade_enabled_var.get()
-            self.config["fade_enabled"] = v
+        def show_fade(v):
             fade_btn.config(
                 bg="#a6e3a1" if v else BTN_BG,
                 fg="#1e1e2e" if v else DIM,
                 text="Enabled" if v else "Disabled")
 
-        fade_btn = tk.Button(fade_row,
-                             command=lambda: [
-                                 self.fade_enabled_var.set(not self.fade_enabled_var.get()),
-                                 toggle_fade()],
-                             relief="flat", font=("Segoe UI", 9, "bold"),
+        def toggle_fade():
+            v = not self.fade_enabled_var.get()
+            self.fade_enabled_var.set(v)
+            self._set_config("fade_enabled", v)
+            show_fade(v)
+
+        fade_btn = tk.Button(fade_row, command=toggle_fade,
+                             relief="flat", font=ui_font(9, "bold"),
                              padx=12, pady=4, cursor="hand2")
         fade_btn.pack(side="left")
-        toggle_fade()
+        show_fade(self.fade_enabled_var.get())
 
         duck_card = tk.Frame(parent, bg=CARD, padx=16, pady=12)
         duck_card.pack(fill="x", padx=24, pady=4)
@@ -847,30 +1269,20 @@ class App:
         duck_top = tk.Frame(duck_card, bg=CARD)
         duck_top.pack(fill="x")
         label(duck_top, "When External Audio Detected", bold=True).pack(side="left")
-        self.duck_label = tk.Label(duck_top, bg=CARD, fg=ACC, font=("Segoe UI", 10, "bold"))
+        self.duck_label = tk.Label(duck_top, bg=CARD, fg=ACC, font=ui_font(10, "bold"))
         self.duck_label.pack(side="right")
 
         label(duck_card, "0% = Stop ambient   |   1-99% = Duck volume   |   100% = Keep playing",
               size=8, color=DIM).pack(anchor="w", pady=(2, 6))
 
-        self.duck_var = tk.IntVar(value=int(self.config.get("duck_percent", 0)))
-
-        def on_duck_change(val):
-            v = int(float(val))
-            self.config["duck_percent"] = v
-            if v == 0:
-                self.duck_label.config(text="Stop (0%)")
-            elif v == 100:
-                self.duck_label.config(text="Keep Playing (100%)")
-            else:
-                self.duck_label.config(text=f"Duck to {v}%")
+        self.duck_var = tk.IntVar(value=self.config["duck_percent"])
 
-        tk.Scale(duck_card, from_=0, to=100, orient="horizontal",
-                 variable=self.duck_var, command=on_duck_change,
+        tk.Scale(duck_card, from_=0, to=100, resolution=1, orient="horizontal",
+                 variable=self.duck_var, command=self._on_duck_change,
                  bg=CARD, fg=FG, troughcolor=BTN_BG,
                  highlightthickness=0, sliderrelief="flat",
                  length=460, showvalue=False).pack(fill="x")
-        on_duck_change(self.duck_var.get())
+        self._apply_duck(self.duck_var.get())
 
         btn_frame = tk.Frame(parent, bg=BG)
         btn_frame.pack(pady=6)
@@ -880,14 +1292,25 @@ class App:
 
         _refresh_mode()
 
+    def _on_duck_change(self, val):
+        # A drag fires once per step; only the value it settles on is applied
+        if self._duck_after_id:
+            self.root.after_cancel(self._duck_after_id)
+        self._duck_after_id = self.root.after(30, self._apply_duck, int(val))
+
+    def _apply_duck(self, v):
+        self._duck_after_id = None
+        self._set_config("duck_percent", v)
+        self.duck_label.config(text=self._DUCK_LABELS[min(max(v, 0), 100)])
+
     def _build_exclude_tab(self, parent, BG, CARD, FG, ACC, BTN_BG, DIM):
         card = tk.Frame(parent, bg=CARD, padx=16, pady=12)
         card.pack(fill="both", padx=24, pady=12, expand=True)
 
         tk.Label(card, text="Exclude Apps", bg=CARD, fg=FG,
-                 font=("Segoe UI", 11, "bold")).pack(anchor="w", pady=(0, 2))
+                 font=ui_font(11, "bold")).pack(anchor="w", pady=(0, 2))
         tk.Label(card, text="Sound from these apps will be ignored by Silence Player.",
-                 bg=CARD, fg=DIM, font=("Segoe UI", 9)).pack(anchor="w", pady=(0, 8))
+                 bg=CARD, fg=DIM, font=ui_font(9)).pack(anchor="w", pady=(0, 8))
 
         list_frame = tk.Frame(card, bg=CARD)
         list_frame.pack(fill="both", expand=True)
@@ -899,63 +1322,71 @@ class App:
             list_frame, yscrollcommand=scrollbar.set,
             bg=BTN_BG, fg=FG,
             selectbackground=ACC, selectforeground="#1e1e2e",
-            relief="flat", font=("Segoe UI", 10),
-            height=8, borderwidth=0)
+            relief="flat", font=ui_font(10),
+            height=8, borderwidth=0, exportselection=False)
         self.exclude_listbox.pack(fill="both", expand=True)
         scrollbar.config(command=self.exclude_listbox.yview)
-
-        for app_name in self.config.get("excluded_apps", []):
-            self.exclude_listbox.insert(tk.END, app_name)
+        # The tab is built just before it is first shown; fill it in one insert
+        self._populate_excludes(self._excluded)
 
         add_frame = tk.Frame(card, bg=CARD)
         add_frame.pack(fill="x", pady=(8, 0))
 
-        self.exclude_entry_var = tk.StringVar()
-        add_entry = tk.Entry(add_frame, textvariable=self.exclude_entry_var,
-                             bg=BTN_BG, fg=FG, insertbackground=FG,
-                             relief="flat", font=("Segoe UI", 10), bd=6, width=22)
-        add_entry.pack(side="left", fill="x", expand=True)
+        self.exclude_entry = tk.Entry(add_frame,
+                                      bg=BTN_BG, fg=FG, insertbackground=FG,
+                                      relief="flat", font=ui_font(10), bd=6, width=22)
+        self.exclude_entry.pack(side="left", fill="x", expand=True)
 
         tk.Label(add_frame, text="e.g. discord.exe", bg=CARD, fg=DIM,
-                 font=("Segoe UI", 8)).pack(side="left", padx=(6, 0))
-
-        def add_app():
-            name = self.exclude_entry_var.get().strip().lower()
-            if not name:
-                return
-            if not name.endswith(".exe"):
-                name += ".exe"
-            if name in list(self.exclude_listbox.get(0, tk.END)):
-                return
-            self.exclude_listbox.insert(tk.END, name)
-            self.exclude_entry_var.set("")
-            self._sync_excluded_apps()
-
-        def remove_app():
-            selected = self.exclude_listbox.curselection()
-            if selected:
-                self.exclude_listbox.delete(selected[0])
-                self._sync_excluded_apps()
+                 font=ui_font(8)).pack(side="left", padx=(6, 0))
 
         btn_row = tk.Frame(card, bg=CARD)
         btn_row.pack(fill="x", pady=(6, 0))
 
-        tk.Button(btn_row, text="Add", command=add_app,
+        tk.Button(btn_row, text="Add", command=self._exclude_add,
                   bg=ACC, fg="#1e1e2e", relief="flat",
-                  font=("Segoe UI", 10, "bold"),
+                  font=ui_font(10, "bold"),
                   padx=16, pady=5, cursor="hand2").pack(side="left", padx=(0, 6))
-        tk.Button(btn_row, text="Remove Selected", command=remove_app,
+        tk.Button(btn_row, text="Remove Selected", command=self._exclude_remove,
                   bg=BTN_BG, fg="#f38ba8", relief="flat",
-                  font=("Segoe UI", 10, "bold"),
+                  font=ui_font(10, "bold"),
                   padx=16, pady=5, cursor="hand2").pack(side="left")
 
-        add_entry.bind("<Return>", lambda e: add_app())
+        self.exclude_entry.bind("<Return>", self._on_exclude_enter)
+
+    def _populate_excludes(self, apps):
+        if apps:
+            self.exclude_listbox.insert(0, *apps)
+
+    def _exclude_add(self):
+        name = self.exclude_entry.get().strip().casefold()
+        if not name:
+            return
+        if not name.endswith(self._EXE_SUFFIXES):
+            name += ".exe"
+        if name in self._excluded_set:
+            return
+        self._excluded.append(name)
+        self._excluded_set.add(name)
+        self.exclude_listbox.insert(tk.END, name)
+        self.exclude_entry.delete(0, tk.END)
+        self._sync_excluded_apps()
+
+    def _exclude_remove(self):
+        selected = self.exclude_listbox.curselection()
+        if selected:
+            self._excluded_set.discard(self._excluded.pop(selected[0]))
+            self.exclude_listbox.delete(selected[0])
+            self._sync_excluded_apps()
+
+    def _on_exclude_enter(self, event):
+        self._exclude_add()
 
     def _build_advanced_tab(self, parent, BG, CARD, FG, ACC, BTN_BG, DIM):
         tk.Label(parent, text="Advanced Settings", bg=BG, fg=ACC,
-                 font=("Segoe UI", 12, "bold")).pack(pady=(16, 2))
+                 font=ui_font(12, "bold")).pack(pady=(16, 2))
         tk.Label(parent, text="Experimental features — may behave unexpectedly.",
-                 bg=BG, fg=DIM, font=("Segoe UI", 9)).pack(pady=(0, 12))
+                 bg=BG, fg=DIM, font=ui_font(9)).pack(pady=(0, 12))
 
         card = tk.Frame(parent, bg=CARD, padx=16, pady=14)
         card.pack(fill="x", padx=24, pady=4)
@@ -964,37 +1395,37 @@ class App:
         title_row.pack(fill="x")
 
         tk.Label(title_row, text="Discord Mirroring Fix",
-                 bg=CARD, fg=FG, font=("Segoe UI", 10, "bold")).pack(side="left")
+                 bg=CARD, fg=FG, font=ui_font(10, "bold")).pack(side="left")
         tk.Label(title_row, text="EXPERIMENTAL",
                  bg="#f38ba8", fg="#1e1e2e",
-                 font=("Segoe UI", 8, "bold"),
+                 font=ui_font(8, "bold"),
                  padx=6, pady=2).pack(side="left", padx=(8, 0))
 
         self.mirror_fix_var = tk.BooleanVar(value=self.config.get("discord_mirror_fix", False))
-        mirror_status = tk.Label(card, bg=CARD, font=("Segoe UI", 9, "bold"))
+        mirror_status = tk.Label(card, bg=CARD, font=ui_font(9, "bold"))
 
-        def toggle_mirror_fix():
-            v = self.mirror_fix_var.get()
-            self.config["discord_mirror_fix"] = v
+        def show_mirror_fix(v):
             mirror_btn.config(
                 bg="#a6e3a1" if v else BTN_BG,
                 fg="#1e1e2e" if v else DIM,
                 text="Enabled" if v else "Disabled")
+            mirror_status.config(
+                text="● Active — monitoring Discord's output stream" if v else "● Off",
+                fg="#a6e3a1" if v else DIM)
+
+        def toggle_mirror_fix():
+            v = not self.mirror_fix_var.get()
+            self.mirror_fix_var.set(v)
+            self._set_config("discord_mirror_fix", v)
             if v:
                 self._start_discord_fix()
-                mirror_status.config(
-                    text="● Active — monitoring Discord's output stream",
-                    fg="#a6e3a1")
             else:
                 self._stop_discord_fix()
-                mirror_status.config(text="● Off", fg=DIM)
-            save_config(self.config)
-
-        mirror_btn = tk.Button(title_row,
-                               command=lambda: [
-                                   self.mirror_fix_var.set(not self.mirror_fix_var.get()),
-                                   toggle_mirror_fix()],
-                               relief="flat", font=("Segoe UI", 9, "bold"),
+            show_mirror_fix(v)
+            self._schedule_save()
+
+        mirror_btn = tk.Button(title_row, command=toggle_mirror_fix,
+                               relief="flat", font=ui_font(9, "bold"),
                                padx=12, pady=4, cursor="hand2")
         mirror_btn.pack(side="right")
 
@@ -1004,68 +1435,146 @@ class App:
                       "This fix taps Discord's actual speaker output directly.\n"
                       "If Discord outputs nothing → it's only capturing → ignored.\n"
                       "If Discord outputs audio → real sound → ambient stops.",
-                 bg=CARD, fg=DIM, font=("Segoe UI", 9),
+                 bg=CARD, fg=DIM, font=ui_font(9),
                  justify="left").pack(anchor="w", pady=(8, 6))
 
         mirror_status.pack(anchor="w")
+        show_mirror_fix(self.mirror_fix_var.get())
 
-        v = self.mirror_fix_var.get()
-        mirror_btn.config(
-            bg="#a6e3a1" if v else BTN_BG,
-            fg="#1e1e2e" if v else DIM,
-            text="Enabled" if v else "Disabled")
-        mirror_status.config(
-            text="● Active — monitoring Discord's output stream" if v else "● Off",
-            fg="#a6e3a1" if v else DIM)
-        if v:
-            self._start_discord_fix()
+    def _set_config(self, key, value):
+        if self.config.get(key) != value:
+            self.config[key] = value
+            self._config_dirty = True
+            self.config_version += 1
+
+    def _save_config(self):
+        if self._config_dirty:
+            self._enqueue_save(dict(self.config))
+            self._config_dirty = False
+
+    def _enqueue_save(self, cfg):
+        # Last write wins: drop a snapshot the writer hasn't picked up yet
+        try:
+            self._save_q.get_nowait()
+        except queue.Empty:
+            pass
+        self._save_q.put(cfg)
+
+    def _save_loop(self):
+        while True:
+            cfg = self._save_q.get()
+            if cfg is None:
+                return
+            try:
+                save_config(cfg)
+            except Exception:
+                pass
+
+    def _stop_save_thread(self):
+        # Queued behind any pending snapshot, so the final write still lands
+        self._save_q.put(None)
+        self._save_thread.join(timeout=2.0)
+
+    def _schedule_save(self):
+        # Coalesce bursts of edits into a single write
+        if self._save_after_id:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(500, self._flush_config)
+
+    def _flush_config(self):
+        if self._save_after_id:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        self._save_config()
 
     def _sync_excluded_apps(self):
-        self.config["excluded_apps"] = list(self.exclude_listbox.get(0, tk.END))
-        save_config(self.config)
+        self._set_config("excluded_apps", list(self._excluded))
+        self.blocked_apps = get_blocked_apps(self._excluded)
+        self._schedule_save()
 
     def _browse_mp3(self):
+        current = self.config.get("mp3_path") or ""
         path = filedialog.askopenfilename(
+            parent=self.root,
             title="Select ambient audio file",
-            filetypes=[("Audio files", "*.mp3 *.opus *.m4a *.flac *.mp4"),
-                       ("All files", "*.*")])
+            filetypes=self._AUDIO_FILETYPES,
+            initialdir=os.path.dirname(current) or None,
+            initialfile=os.path.basename(current))
         if path:
-            self.mp3_var.set(path)
-            self.config["mp3_path"] = path
+            self.mp3_entry.delete(0, tk.END)
+            self.mp3_entry.insert(0, path)
+            self._set_config("mp3_path", path)
+            self._path_cache.pop("mp3_path", None)
 
     def _browse_playlist(self):
-        folder = filedialog.askdirectory(title="Select folder with audio files")
+        folder = filedialog.askdirectory(
+            parent=self.root,
+            title="Select folder with audio files",
+            initialdir=self.config.get("playlist_folder") or None)
         if folder:
-            self.playlist_var.set(folder)
-            self.config["playlist_folder"] = folder
+            self.playlist_entry.delete(0, tk.END)
+            self.playlist_entry.insert(0, folder)
+            self._set_config("playlist_folder", folder)
+            self._path_cache.pop("playlist_folder", None)
 
     def _save_settings(self):
         if not self._read_inputs():
             return
-        save_config(self.config)
+        self._save_config()
         self.set_status("Settings saved!")
 
+    def _validate_range(self, proposed, hi):
+        # Keystroke filter: plain decimal digits, never above hi; empty while editing
+        if proposed == "":
+            return True
+        if not (proposed.isascii() and proposed.isdigit()):
+            return False
+        return int(proposed) <= int(hi)
+
     def _read_inputs(self):
         try:
-            silence = int(self.silence_var.get())
-            vol     = int(self.vol_var.get())
-            assert 1 <= silence <= 3600
-            assert 0 <= vol <= 100
-        except (ValueError, AssertionError) as e:
-            messagebox.showerror("Invalid input", str(e))
+            silence = int(self.silence_entry.get())
+            vol     = int(self.vol_entry.get())
+        except ValueError:
+            messagebox.showerror("Invalid input",
+                                 "Silence timeout and max volume must be whole numbers.")
+            return False
+        # The keystroke filter never sees values loaded from config.json
+        if not 1 <= silence <= 3600:
+            messagebox.showerror("Invalid input",
+                                 "Silence timeout must be between 1 and 3600 seconds.")
             return False
-        self.config["mp3_path"]           = self.mp3_var.get()
-        self.config["playlist_folder"]    = self.playlist_var.get()
-        self.config["silence_seconds"]    = silence
-        self.config["max_volume"]         = vol
-        self.config["fade_enabled"]       = self.fade_enabled_var.get()
-        self.config["mode"]               = self.mode_var.get()
-        self.config["single_loop_mode"]   = self.single_loop_var.get()
-        self.config["playlist_loop_mode"] = self.playlist_loop_var.get()
-        self.config["duck_percent"]       = self.duck_var.get()
+        if not 0 <= vol <= 100:
+            messagebox.showerror("Invalid input",
+                                 "Max volume must be between 0 and 100.")
+            return False
+        new_values = {
+            "mp3_path":           self.mp3_entry.get(),
+            "playlist_folder":    self.playlist_entry.get(),
+            "silence_seconds":    silence,
+            "max_volume":         vol,
+            "fade_enabled":       self.fade_enabled_var.get(),
+            "duck_percent":       self.duck_var.get(),
+        }
+        # _set_config only touches (and dirties) keys whose value changed
+        for key, value in new_values.items():
+            self._set_config(key, value)
         return True
 
+    def _path_ok(self, key, predicate):
+        path = self.config[key]
+        now = time.monotonic()
+        cached = self._path_cache.get(key)
+        if cached and cached[0] == path and now - cached[2] < 2.0:
+            return cached[1]
+        ok = predicate(path)
+        self._path_cache[key] = (path, ok, now)
+        return ok
+
     def _start_monitoring(self):
+        # The only place the monitor is started; it must not run twice
+        if self.monitoring:
+            return
         self.monitoring = True
         self.monitor.start()
         self.start_btn.config(text="Stop Monitoring", fg="#f38ba8")
@@ -1074,59 +1583,107 @@ class App:
         if self.monitoring:
             self.monitoring = False
             self.monitor.stop()
-            self.player.stop()
+            # stop() fades out; doing that here would hold the idle-queued
+            # status and button redraws back until the fade finished
+            threading.Thread(target=self.player.stop, daemon=True).start()
             self.set_status("Monitoring stopped.")
+            self.set_tray_title("Silence Player — Stopped")
             self.start_btn.config(text="Start Monitoring", fg="#a6e3a1")
         else:
             if not self._read_inputs():
                 return
             mode = self.config["mode"]
-            if mode == "single" and not os.path.exists(self.config["mp3_path"]):
+            if mode == "single" and not self._path_ok("mp3_path", os.path.exists):
                 messagebox.showerror("No file", "Please select a valid audio file first.")
                 return
-            if mode == "playlist" and not os.path.isdir(self.config["playlist_folder"]):
+            if mode == "playlist" and not self._path_ok("playlist_folder", os.path.isdir):
                 messagebox.showerror("No folder", "Please select a valid playlist folder first.")
                 return
-            self.monitoring = True
-            self.monitor.start()
-            self.set_status("Monitoring... waiting for silence.")
-            self.start_btn.config(text="Stop Monitoring", fg="#f38ba8")
+            self._start_monitoring()
 
     def play_ambient(self):
         self.set_status("Silence reached — playing ambient sound...")
         self.player.play(self.config)
 
     def duck_ambient(self, target_vol):
-        threading.Thread(target=self.player.duck, args=(target_vol,), daemon=True).start()
+        if self._closing:
+            return
+        self._duck_q.put((self.player.duck, target_vol))
 
     def unduck_ambient(self, target_vol):
-        threading.Thread(target=self.player.unduck, args=(target_vol,), daemon=True).start()
+        if self._closing:
+            return
+        self._duck_q.put((self.player.unduck, target_vol))
+
+    def _duck_loop(self):
+        while True:
+            job = self._duck_q.get()
+            # Skip to the newest request so we never ramp to a stale level
+            while job is not None:
+                try:
+                    job = self._duck_q.get_nowait()
+                except queue.Empty:
+                    break
+            if job is None:
+                return
+            ramp, target_vol = job
+            ramp(target_vol)
 
     def stop_ambient(self):
         self.player.stop()
 
     def stop_monitoring(self):
+        if self._closing:
+            return
         self.monitoring = False
         self.monitor.stop()
         self.set_status("Playback finished — monitoring stopped.")
+        self.set_tray_title("Silence Player — Stopped")
         try:
-            self.root.after(0, lambda: self.start_btn.config(
-                text="Start Monitoring", fg="#a6e3a1"))
+            self.root.after_idle(self._set_start_btn, "Start Monitoring", "#a6e3a1")
         except Exception:
             pass
 
+    def _set_start_btn(self, text, fg):
+        self.start_btn.config(text=text, fg=fg)
+
     def set_status(self, msg, error=False):
+        if self._closing or msg == self._status:
+            return
         self._status = msg
+        # Bursts of updates share one idle callback that shows the latest
+        if self._status_pending:
+            return
+        self._status_pending = True
         try:
-            self.root.after(0, lambda: self.status_var.set(msg))
+            self.root.after_idle(self._flush_status)
         except Exception:
-            pass
+            self._status_pending = False
+
+    def _flush_status(self):
+        self._status_pending = False
+        self.status_var.set(self._status)
+
+    def set_tray_title(self, title):
+        if title == self._tray_title:
+            return
+        self._tray_title = title
+        if self.tray:
+            try:
+                self.tray.title = title
+            except Exception:
+                pass
 
     def _on_close(self):
+        if self._closing:
+            return
+        self._closing = True
         self.monitor.stop()
         self.player.stop()
         self._stop_discord_fix()
-        save_config(self.config)
+        self._flush_config()
+        self._stop_save_thread()
+        self._duck_q.put(None)
         self.root.destroy()
 
 